@@ -21,11 +21,15 @@ Protocol Message Types Handled:
 
 Usage:
     python echo_server.py [--port PORT] [--host HOST] [--verbose]
+                          [--socket-buffer BYTES]
     
     Default: ws://127.0.0.1:9001
 
 Requirements:
+    Python 3.10+
     pip install websockets
+    pip install orjson      (optional, faster JSON decode)
+    pip install uvloop      (optional, faster event loop; not on Windows)
 
 Author: TallyIX Team
 Version: 2.0
@@ -35,12 +39,26 @@ import asyncio
 import websockets
 import json
 import argparse
+import atexit
+import itertools
 import signal
+import socket
 import sys
+import time
+from array import array
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, Set
-from enum import Enum
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup; unavailable on Windows
+    uvloop = None
 
 
 # ============================================================================
@@ -49,6 +67,8 @@ from enum import Enum
 
 class Colors:
     """ANSI color codes for colorized console output."""
+    __slots__ = ()
+    
     RESET = "\033[0m"
     BOLD = "\033[1m"
     
@@ -67,21 +87,106 @@ class Colors:
 # Logging Utilities
 # ============================================================================
 
-class LogLevel(Enum):
+# A log level is a (label, color) pair; compare levels by identity
+Level = Tuple[str, str]
+
+
+class LogLevel:
     """Log severity levels."""
-    DEBUG = "DBG"
-    INFO = "INF"
-    WARNING = "WRN"
-    ERROR = "ERR"
+    __slots__ = ()
+    
+    DEBUG: Level = ("DBG", Colors.GRAY)
+    INFO: Level = ("INF", Colors.GREEN)
+    WARNING: Level = ("WRN", Colors.YELLOW)
+    ERROR: Level = ("ERR", Colors.RED)
+
+
+# [epoch second, "HH:MM:SS"] - strftime only runs once per second
+_ts_cache = [0, ""]
 
 
 def get_timestamp() -> str:
     """Get current timestamp in HH:MM:SS.mmm format."""
-    now = datetime.now()
-    return now.strftime("%H:%M:%S") + f".{now.microsecond // 1000:03d}"
+    t = time.time()
+    sec = int(t)
+    if sec != _ts_cache[0]:
+        _ts_cache[:] = [sec, time.strftime("%H:%M:%S", time.localtime(sec))]
+    return f"{_ts_cache[1]}.{int((t - sec) * 1000):03d}"
+
+
+# Decorated "[LEVEL][Tag] " segment per (level, tag) pair
+_prefix_cache: Dict[Tuple[Level, str], str] = {}
+
 
+def _build_prefix(level: Level, tag: str) -> str:
+    """Build the colorized "[LEVEL][Tag] " segment of a log line."""
+    label, color = level
+    return (f"[{color}{label}{Colors.RESET}]"
+            f"[{Colors.CYAN}{tag}{Colors.RESET}] ")
 
-def log(level: LogLevel, tag: str, message: str, verbose: bool = True):
+
+# Encoded log output waiting to be written to stdout
+LOG_FLUSH_BYTES = 4096           # Flush once this much is pending
+LOG_FLUSH_DELAY = 0.01           # ...or this many seconds after the first line
+_LOG_ENCODING = getattr(sys.stdout, "encoding", None) or "utf-8"
+_log_buf = bytearray()
+_log_flush_handle: Optional[asyncio.TimerHandle] = None
+_log_flush_loop: Optional[asyncio.AbstractEventLoop] = None  # Loop owning the handle
+
+
+def flush_log():
+    """Write any buffered log output to stdout."""
+    global _log_flush_handle, _log_flush_loop
+    if _log_flush_handle is not None:
+        _log_flush_handle.cancel()
+        _log_flush_handle = None
+        _log_flush_loop = None
+    if not _log_buf:
+        return
+    
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # stdout was replaced by a text-only stream
+        sys.stdout.write(_log_buf.decode(_LOG_ENCODING, "replace"))
+        sys.stdout.flush()
+    else:
+        sys.stdout.flush()  # Keep ordering with any print() output
+        out.write(_log_buf)
+        out.flush()
+    _log_buf.clear()
+
+
+atexit.register(flush_log)
+
+
+def _write_log_line(line: str, urgent: bool = False):
+    """
+    Append a formatted line to the log buffer.
+    
+    Inside a running event loop the buffer is flushed when it grows past
+    LOG_FLUSH_BYTES or LOG_FLUSH_DELAY after the first pending line;
+    urgent lines and lines logged outside an event loop are written
+    immediately.
+    """
+    global _log_flush_handle, _log_flush_loop
+    _log_buf.extend(line.encode(_LOG_ENCODING, "replace"))
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    if urgent or loop is None or len(_log_buf) >= LOG_FLUSH_BYTES:
+        flush_log()
+    elif _log_flush_handle is None or _log_flush_loop is not loop:
+        # A handle left over from an earlier (now closed) loop never fires
+        if _log_flush_handle is not None:
+            _log_flush_handle.cancel()
+        _log_flush_handle = loop.call_later(LOG_FLUSH_DELAY, flush_log)
+        _log_flush_loop = loop
+
+
+def log(level: Level, tag: str, message: str, verbose: bool = True):
     """
     Log a message with timestamp, level, and tag.
     
@@ -91,34 +196,30 @@ def log(level: LogLevel, tag: str, message: str, verbose: bool = True):
         message: Message content
         verbose: If False, only show INFO and above
     """
-    if not verbose and level == LogLevel.DEBUG:
+    if not verbose and level is LogLevel.DEBUG:
         return
     
-    # Color mapping for levels
-    level_colors = {
-        LogLevel.DEBUG: Colors.GRAY,
-        LogLevel.INFO: Colors.GREEN,
-        LogLevel.WARNING: Colors.YELLOW,
-        LogLevel.ERROR: Colors.RED,
-    }
-    
-    color = level_colors.get(level, Colors.WHITE)
-    timestamp = get_timestamp()
+    prefix = _prefix_cache.get((level, tag))
+    if prefix is None:
+        prefix = _prefix_cache[(level, tag)] = _build_prefix(level, tag)
     
-    print(f"{Colors.GRAY}{timestamp}{Colors.RESET} "
-          f"[{color}{level.value}{Colors.RESET}]"
-          f"[{Colors.CYAN}{tag}{Colors.RESET}] "
-          f"{message}")
+    _write_log_line(f"{Colors.GRAY}{get_timestamp()}{Colors.RESET} {prefix}{message}\n",
+                    urgent=level is LogLevel.WARNING or level is LogLevel.ERROR)
 
 
 # ============================================================================
 # Statistics Tracking
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionStats:
-    """Statistics for a single WebSocket connection."""
+    """
+    Statistics for a single WebSocket connection.
+    
+    Instances are pooled by TallyIXMockServer and recycled via reset().
+    """
     client_id: str
+    conn_id: int = 0
     connected_at: datetime = field(default_factory=datetime.now)
     messages_received: int = 0
     messages_sent: int = 0
@@ -127,36 +228,96 @@ class ConnectionStats:
     binary_transfers_completed: int = 0
     current_binary_expected: int = 0
     current_binary_received: int = 0
-
-
-@dataclass 
+    
+    def reset(self, client_id: str, conn_id: int):
+        """Reinitialize all fields for a new connection."""
+        self.client_id = client_id
+        self.conn_id = conn_id
+        self.connected_at = datetime.now()
+        self.messages_received = 0
+        self.messages_sent = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.binary_transfers_completed = 0
+        self.current_binary_expected = 0
+        self.current_binary_received = 0
+
+
+@dataclass(slots=True)
 class ServerStats:
     """Global server statistics."""
     total_connections: int = 0
     active_connections: int = 0
-    total_messages: int = 0
-    total_bytes: int = 0
     started_at: datetime = field(default_factory=datetime.now)
+    # [total_messages, total_bytes] packed as unsigned 64-bit counters
+    _counters: array = field(default_factory=lambda: array("Q", [0, 0]), repr=False)
+    
+    @property
+    def total_messages(self) -> int:
+        """Total messages received across all connections."""
+        return self._counters[0]
+    
+    @property
+    def total_bytes(self) -> int:
+        """Total bytes received across all connections."""
+        return self._counters[1]
+    
+    def __repr__(self) -> str:
+        return (f"ServerStats(total_connections={self.total_connections!r}, "
+                f"active_connections={self.active_connections!r}, "
+                f"total_messages={self.total_messages!r}, "
+                f"total_bytes={self.total_bytes!r}, "
+                f"started_at={self.started_at!r})")
+    
+    def add_traffic(self, messages: int, nbytes: int):
+        """Add received message and byte counts to the totals."""
+        counters = self._counters
+        counters[0] += messages
+        counters[1] += nbytes
 
 
 # ============================================================================
 # Protocol Message Handling
 # ============================================================================
 
-def parse_protocol_message(data: str) -> Optional[dict]:
+# Pre-built wire templates for the messages the server generates itself.
+# String fields are substituted already quoted/escaped by _encode_str.
+_ACK_TEMPLATE = '{"type":"ack","msg_id":%s,"content":%s,"original_msg_id":%s}'
+_ERROR_TEMPLATE = '{"type":"error","msg_id":%s,"content":%s}'
+_encode_str = json.encoder.encode_basestring_ascii
+
+
+def parse_protocol_message(data: Union[str, bytes]) -> Optional[dict]:
     """
     Parse a JSON protocol message.
     
     Args:
-        data: JSON string to parse
+        data: JSON string (or raw UTF-8 bytes) to parse
         
     Returns:
-        Parsed dictionary or None if parsing fails
+        Parsed dictionary or None if parsing fails or the payload
+        is not a JSON object
     """
+    if orjson is not None:
+        try:
+            parsed = orjson.loads(data)
+        except ValueError:  # orjson.JSONDecodeError
+            # orjson rejects some input the stdlib accepts (NaN, lone
+            # surrogate escapes, out-of-range floats); let json decide
+            pass
+        else:
+            if not isinstance(parsed, dict):
+                return None
+            # orjson decodes integers beyond 64 bits as floats; re-parse with
+            # the stdlib so such message IDs are echoed back exactly
+            if not isinstance(parsed.get("msg_id"), float):
+                return parsed
+    
     try:
-        return json.loads(data)
+        parsed = json.loads(data)
     except json.JSONDecodeError:
         return None
+    return parsed if isinstance(parsed, dict) else None
 
 
 def create_ack_message(msg_id: str, content: str = "Message received") -> str:
@@ -170,6 +331,11 @@ def create_ack_message(msg_id: str, content: str = "Message received") -> str:
     Returns:
         JSON string for ACK message
     """
+    if isinstance(msg_id, str) and isinstance(content, str):
+        return _ACK_TEMPLATE % (
+            _encode_str(f"ack_{msg_id}"), _encode_str(content), _encode_str(msg_id))
+    # Non-string IDs (e.g. numbers from the client) keep their JSON type;
+    # the stdlib encoder matches how json.loads decoded them
     return json.dumps({
         "type": "ack",
         "msg_id": f"ack_{msg_id}",
@@ -189,6 +355,8 @@ def create_error_message(msg_id: str, reason: str) -> str:
     Returns:
         JSON string for error message
     """
+    if isinstance(msg_id, str) and isinstance(reason, str):
+        return _ERROR_TEMPLATE % (_encode_str(msg_id), _encode_str(reason))
     return json.dumps({
         "type": "error",
         "msg_id": msg_id,
@@ -200,6 +368,13 @@ def create_error_message(msg_id: str, reason: str) -> str:
 # WebSocket Handler
 # ============================================================================
 
+# Maximum number of idle ConnectionStats objects kept for reuse
+STATS_POOL_SIZE = 1024
+
+# websockets write-drain high-water mark
+WRITE_LIMIT = 1 << 20            # 1MB
+
+
 class TallyIXMockServer:
     """
     TallyIX Mock WebSocket Server.
@@ -208,7 +383,13 @@ class TallyIXMockServer:
     and provides echo functionality for testing.
     """
     
-    def __init__(self, host: str = "127.0.0.1", port: int = 9001, verbose: bool = False):
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9001,
+        verbose: bool = False,
+        socket_buffer_size: int = 0
+    ):
         """
         Initialize the mock server.
         
@@ -216,22 +397,70 @@ class TallyIXMockServer:
             host: Host address to bind to
             port: Port number to listen on
             verbose: Enable debug logging
+            socket_buffer_size: SO_RCVBUF/SO_SNDBUF for accepted sockets;
+                0 keeps the kernel's buffer autotuning
         """
         self.host = host
         self.port = port
         self.verbose = verbose
+        self.socket_buffer_size = socket_buffer_size
+        self._debug = verbose  # Hot-path guard for DEBUG log construction
         self.server_stats = ServerStats()
         self.active_connections: Set[websockets.WebSocketServerProtocol] = set()
-        self.connection_stats: dict[str, ConnectionStats] = {}
+        self._conn_ids = itertools.count(1)
+        self._stats_pool: List[ConnectionStats] = []
         self._shutdown_event = asyncio.Event()
     
-    def _log(self, level: LogLevel, tag: str, message: str):
+    def _log(self, level: Level, tag: str, message: str):
         """Helper to log with server's verbose setting."""
-        log(level, tag, message, self.verbose or level != LogLevel.DEBUG)
+        if level is LogLevel.DEBUG and not self._debug:
+            return
+        log(level, tag, message)
+    
+    def _tune_socket(self, websocket: websockets.WebSocketServerProtocol):
+        """
+        Apply socket options to an accepted connection.
+        
+        Enables TCP keepalive. TCP_NODELAY is not set here because
+        asyncio and uvloop already enable it on every TCP transport.
+        Explicit buffer sizes disable Linux TCP autotuning for the socket
+        and are capped by net.core.rmem_max/wmem_max, so they are only
+        set when requested.
+        """
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if self.socket_buffer_size:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer_size)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_buffer_size)
+        except (OSError, OverflowError, TypeError) as e:
+            self._log(LogLevel.WARNING, "Server", f"Could not tune socket options: {e}")
     
     def _get_client_id(self, websocket: websockets.WebSocketServerProtocol) -> str:
         """Generate a unique client identifier."""
-        return f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
+        address = websocket.remote_address
+        return "%s:%d" % (address[0], address[1])
+    
+    async def _send_many(
+        self,
+        websocket: websockets.WebSocketServerProtocol,
+        frames: Sequence[Union[str, bytes]],
+        stats: ConnectionStats
+    ):
+        """
+        Send one or more complete messages, in order, and update send statistics.
+        
+        Args:
+            websocket: The WebSocket connection
+            frames: Messages to send, in order
+            stats: Connection statistics to update
+        """
+        for frame in frames:
+            await websocket.send(frame)
+        stats.messages_sent += len(frames)
+        stats.bytes_sent += sum(len(frame) for frame in frames)
     
     async def handle_text_message(
         self, 
@@ -242,90 +471,73 @@ class TallyIXMockServer:
         """
         Handle an incoming text message.
         
+        Receive counters are accumulated by handle_connection().
+        
         Args:
             websocket: The WebSocket connection
             message: The text message received
             stats: Connection statistics to update
         """
-        stats.messages_received += 1
-        stats.bytes_received += len(message)
-        self.server_stats.total_messages += 1
-        self.server_stats.total_bytes += len(message)
+        # Try to parse as protocol message; protocol messages are JSON
+        # objects, so anything else skips the parser entirely
+        if message.lstrip()[:1] == "{":
+            parsed = parse_protocol_message(message)
+        else:
+            parsed = None
         
-        # Try to parse as protocol message
-        parsed = parse_protocol_message(message)
+        # Every text message is echoed back; hello also gets an ACK
+        frames = [message]
+        client_id = stats.client_id
         
         if parsed:
-            msg_type = parsed.get("type", "unknown")
-            msg_id = parsed.get("msg_id", "unknown")
-            content = parsed.get("content", "")
+            # Extract the only fields the handler reads, once
+            get = parsed.get
+            msg_type = get("type", "unknown")
+            msg_id = get("msg_id", "unknown")
+            content = get("content", "")
+            binary_size = get("size", 0)
             
             self._log(LogLevel.INFO, "Protocol", 
-                     f"[{stats.client_id}] Received {msg_type} (id={msg_id})")
+                     f"[{client_id}] Received {msg_type} (id={msg_id})")
             
             if msg_type == "hello":
                 # Handle hello message - send acknowledgment
                 self._log(LogLevel.INFO, "Protocol",
-                         f"[{stats.client_id}] Hello: {content}")
-                
-                # Echo back the hello message
-                await websocket.send(message)
-                stats.messages_sent += 1
-                stats.bytes_sent += len(message)
-                
-                # Also send an ACK
-                ack = create_ack_message(msg_id, f"Hello received from {stats.client_id}")
-                await websocket.send(ack)
-                stats.messages_sent += 1
-                stats.bytes_sent += len(ack)
+                         f"[{client_id}] Hello: {content}")
+                frames.append(
+                    create_ack_message(msg_id, f"Hello received from {client_id}"))
                 
-                self._log(LogLevel.DEBUG, "Protocol",
-                         f"[{stats.client_id}] Sent hello echo and ACK")
+                if self._debug:
+                    self._log(LogLevel.DEBUG, "Protocol",
+                             f"[{client_id}] Sending hello echo and ACK")
             
             elif msg_type == "binary_start":
                 # Handle binary transfer metadata
-                binary_size = parsed.get("size", 0)
                 stats.current_binary_expected = binary_size
                 stats.current_binary_received = 0
                 
                 self._log(LogLevel.INFO, "Protocol",
-                         f"[{stats.client_id}] Binary transfer announced: {binary_size:,} bytes")
-                
-                # Echo back the metadata
-                await websocket.send(message)
-                stats.messages_sent += 1
-                stats.bytes_sent += len(message)
+                         f"[{client_id}] Binary transfer announced: {binary_size:,} bytes")
             
             elif msg_type == "ack":
-                self._log(LogLevel.DEBUG, "Protocol",
-                         f"[{stats.client_id}] ACK received: {content}")
-                # Echo ACKs back
-                await websocket.send(message)
-                stats.messages_sent += 1
-                stats.bytes_sent += len(message)
+                if self._debug:
+                    self._log(LogLevel.DEBUG, "Protocol",
+                             f"[{client_id}] ACK received: {content}")
             
             elif msg_type == "error":
                 self._log(LogLevel.WARNING, "Protocol",
-                         f"[{stats.client_id}] Error received: {content}")
-                # Echo errors back
-                await websocket.send(message)
-                stats.messages_sent += 1
-                stats.bytes_sent += len(message)
+                         f"[{client_id}] Error received: {content}")
             
             else:
                 self._log(LogLevel.WARNING, "Protocol",
-                         f"[{stats.client_id}] Unknown type: {msg_type}")
-                # Echo unknown messages
-                await websocket.send(message)
-                stats.messages_sent += 1
-                stats.bytes_sent += len(message)
+                         f"[{client_id}] Unknown type: {msg_type}")
         else:
             # Not valid JSON - just echo it back
-            self._log(LogLevel.DEBUG, "Server",
-                     f"[{stats.client_id}] Non-JSON text ({len(message)} bytes)")
-            await websocket.send(message)
-            stats.messages_sent += 1
-            stats.bytes_sent += len(message)
+            if self._debug:
+                self._log(LogLevel.DEBUG, "Server",
+                         f"[{client_id}] Non-JSON text ({len(message)} bytes)")
+        
+        await self._send_many(websocket, frames, stats)
     
     async def handle_binary_message(
         self,
@@ -336,24 +548,23 @@ class TallyIXMockServer:
         """
         Handle an incoming binary message.
         
+        Receive counters are accumulated by handle_connection().
+        
         Args:
             websocket: The WebSocket connection
             data: The binary data received
             stats: Connection statistics to update
         """
-        stats.messages_received += 1
-        stats.bytes_received += len(data)
         stats.current_binary_received += len(data)
-        self.server_stats.total_messages += 1
-        self.server_stats.total_bytes += len(data)
         
         # Calculate progress
         if stats.current_binary_expected > 0:
-            progress = (stats.current_binary_received / stats.current_binary_expected) * 100
-            self._log(LogLevel.DEBUG, "Binary",
-                     f"[{stats.client_id}] Chunk: {len(data):,} bytes "
-                     f"({stats.current_binary_received:,}/{stats.current_binary_expected:,} "
-                     f"= {progress:.1f}%)")
+            if self._debug:
+                progress = (stats.current_binary_received / stats.current_binary_expected) * 100
+                self._log(LogLevel.DEBUG, "Binary",
+                         f"[{stats.client_id}] Chunk: {len(data):,} bytes "
+                         f"({stats.current_binary_received:,}/{stats.current_binary_expected:,} "
+                         f"= {progress:.1f}%)")
             
             # Check if transfer is complete
             if stats.current_binary_received >= stats.current_binary_expected:
@@ -364,7 +575,7 @@ class TallyIXMockServer:
                          f"(Transfer #{stats.binary_transfers_completed})")
                 stats.current_binary_expected = 0
                 stats.current_binary_received = 0
-        else:
+        elif self._debug:
             self._log(LogLevel.DEBUG, "Binary",
                      f"[{stats.client_id}] Received {len(data):,} bytes (no size announced)")
         
@@ -381,18 +592,29 @@ class TallyIXMockServer:
             websocket: The WebSocket connection
         """
         client_id = self._get_client_id(websocket)
-        stats = ConnectionStats(client_id=client_id)
-        self.connection_stats[client_id] = stats
+        conn_id = next(self._conn_ids)
+        if self._stats_pool:
+            stats = self._stats_pool.pop()
+            stats.reset(client_id, conn_id)
+        else:
+            stats = ConnectionStats(client_id=client_id, conn_id=conn_id)
         self.active_connections.add(websocket)
         self.server_stats.total_connections += 1
         self.server_stats.active_connections += 1
         
         self._log(LogLevel.INFO, "Server",
                  f"{Colors.GREEN}Client connected:{Colors.RESET} {client_id} "
-                 f"(Active: {self.server_stats.active_connections})")
+                 f"(#{stats.conn_id}, Active: {self.server_stats.active_connections})")
+        
+        # Receive counters live in locals and are flushed once on disconnect
+        messages_received = 0
+        bytes_received = 0
         
         try:
+            self._tune_socket(websocket)
             async for message in websocket:
+                messages_received += 1
+                bytes_received += len(message)
                 if isinstance(message, bytes):
                     await self.handle_binary_message(websocket, message, stats)
                 else:
@@ -407,6 +629,11 @@ class TallyIXMockServer:
                      f"Error handling {client_id}: {type(e).__name__}: {e}")
         
         finally:
+            # Flush receive counters
+            stats.messages_received += messages_received
+            stats.bytes_received += bytes_received
+            self.server_stats.add_traffic(messages_received, bytes_received)
+            
             # Cleanup
             self.active_connections.discard(websocket)
             self.server_stats.active_connections -= 1
@@ -421,7 +648,9 @@ class TallyIXMockServer:
                      f"Bytes: {stats.bytes_received:,}↓/{stats.bytes_sent:,}↑, "
                      f"Binary transfers: {stats.binary_transfers_completed}")
             
-            del self.connection_stats[client_id]
+            # Recycle the stats object for the next connection
+            if len(self._stats_pool) < STATS_POOL_SIZE:
+                self._stats_pool.append(stats)
     
     async def start(self):
         """Start the WebSocket server."""
@@ -448,6 +677,8 @@ class TallyIXMockServer:
             ping_timeout=10,       # Wait 10 seconds for pong
             close_timeout=5,       # Wait 5 seconds for close handshake
             max_size=100 * 1024 * 1024,  # 100MB max message size
+            write_limit=WRITE_LIMIT,     # Fewer drain() waits on large echoes
+            compression=None,            # Echo payloads don't benefit from deflate
         ) as server:
             self._log(LogLevel.INFO, "Server",
                      f"{Colors.GREEN}Server is ready and listening!{Colors.RESET}")
@@ -456,6 +687,9 @@ class TallyIXMockServer:
             await self._shutdown_event.wait()
             
             self._log(LogLevel.INFO, "Server", "Shutting down...")
+        
+        # Write pending log lines before the event loop closes
+        flush_log()
     
     def shutdown(self):
         """Signal the server to shut down gracefully."""
@@ -464,6 +698,7 @@ class TallyIXMockServer:
     def print_final_stats(self):
         """Print final server statistics."""
         duration = datetime.now() - self.server_stats.started_at
+        flush_log()
         print()
         self._log(LogLevel.INFO, "Stats", f"{Colors.BOLD}Final Server Statistics:{Colors.RESET}")
         self._log(LogLevel.INFO, "Stats", f"  Uptime: {duration}")
@@ -487,6 +722,7 @@ Examples:
   python echo_server.py --port 8080        # Custom port
   python echo_server.py --verbose          # Enable debug logging
   python echo_server.py --host 0.0.0.0     # Listen on all interfaces
+  python echo_server.py --socket-buffer 4194304  # 4MB socket buffers
         """
     )
     parser.add_argument(
@@ -505,18 +741,34 @@ Examples:
         action="store_true",
         help="Enable verbose (debug) logging"
     )
+    parser.add_argument(
+        "--socket-buffer",
+        type=int,
+        default=0,
+        metavar="BYTES",
+        help="Set SO_RCVBUF/SO_SNDBUF on accepted sockets "
+             "(default: 0, keep kernel autotuning)"
+    )
     
     args = parser.parse_args()
+    if not 0 <= args.socket_buffer < 2**31:
+        parser.error("--socket-buffer must be 0 or a positive value below 2**31")
+    
+    # Use uvloop's libuv-based event loop when it is installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
     # Create server instance
     server = TallyIXMockServer(
         host=args.host,
         port=args.port,
-        verbose=args.verbose
+        verbose=args.verbose,
+        socket_buffer_size=args.socket_buffer
     )
     
     # Set up signal handlers for graceful shutdown
     def signal_handler(signum, frame):
+        flush_log()
         print()  # New line after ^C
         server.shutdown()
     
@@ -532,6 +784,7 @@ Examples:
     finally:
         server.print_final_stats()
         log(LogLevel.INFO, "Server", f"{Colors.GREEN}Goodbye!{Colors.RESET}", True)
+        flush_log()
 
 
 if __name__ == "__main__":